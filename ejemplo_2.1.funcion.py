@@ -1,17 +1,71 @@
-import pytest 
+import math
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+try:
+    import numba
+except ImportError:  # Numba es opcional: sin él se usa la versión con máscaras de NumPy
+    numba = None
+
+# Descuento y precio mínimo (exclusivo) a partir del cual se aplica, por tipo de cliente
+_DESCUENTOS = {'VIP': (0.20, 0.0), 'REGULAR': (0.10, 100.0)}
+_SIN_DESCUENTO = (0.0, math.inf)
+
 def calcular_descuento_final(precio_base: float, tipo_cliente: str) -> float:
- """ 
- Calcula el precio final aplicando un descuento según el tipo de cliente.
- - Clientes 'VIP' tienen un 20% de descuento.
- - Clientes 'REGULAR' tienen un 10% de descuento si la compra supera los 100.
- - Lanza un ValueError si el precio es negativo.
- """ 
- if precio_base < 0:
-    raise ValueError("El precio base no puede ser negativo.")
-descuento = 0.0
-if tipo_cliente == 'VIP':
-    descuento = 0.20 
-elif tipo_cliente == 'REGULAR' and precio_base > 100:
-    descuento = 0.10
-precio_final = precio_base * (1 - descuento)
-return round(precio_final, 2)
+    """
+    Calcula el precio final aplicando un descuento según el tipo de cliente.
+    - Clientes 'VIP' tienen un 20% de descuento.
+    - Clientes 'REGULAR' tienen un 10% de descuento si la compra supera los 100.
+    - Lanza un ValueError si el precio es negativo.
+    Los resultados se guardan en caché por (precio_base, tipo_cliente).
+    """
+    if precio_base < 0:
+        raise ValueError("El precio base no puede ser negativo.")
+    # float() evita que 90, 90.0 y np.float64(90.0) compartan una entrada de caché con tipos distintos
+    return _calcular_descuento_cacheado(float(precio_base), tipo_cliente)
+
+@lru_cache(maxsize=4096)
+def _calcular_descuento_cacheado(precio_base: float, tipo_cliente: str) -> float:
+    descuento, umbral = _DESCUENTOS.get(tipo_cliente, _SIN_DESCUENTO)
+    if precio_base <= umbral:
+        # Sin descuento: basta con redondear, sin multiplicar por 1
+        return round(precio_base, 2)
+    precio_final = precio_base * (1 - descuento)
+    return round(precio_final, 2)
+
+calcular_descuento_final.cache_clear = _calcular_descuento_cacheado.cache_clear
+calcular_descuento_final.cache_info = _calcular_descuento_cacheado.cache_info
+
+def calcular_descuento_final_vec(precios: np.ndarray, tipos: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de calcular_descuento_final para calcular muchos precios a la vez.
+    Aplica las mismas reglas elemento a elemento sobre arrays de NumPy.
+    Si Numba está instalado, el cálculo se hace en una sola pasada con un kernel compilado.
+    tipos puede ser un único tipo o un array que se pueda combinar (broadcast) con precios.
+    - Lanza un ValueError si algún precio es negativo o si las formas no son compatibles.
+    """
+    # Igualar formas antes de nada: el kernel de Numba recorre ambos arrays sin comprobar límites
+    precios, tipos = np.broadcast_arrays(np.asarray(precios, dtype=np.float64), np.asarray(tipos))
+    if (precios < 0).any():
+        raise ValueError("El precio base no puede ser negativo.")
+    if numba is not None:
+        # 0 = otro, 1 = VIP, 2 = REGULAR
+        codigos = np.where(tipos == 'VIP', 1, np.where(tipos == 'REGULAR', 2, 0)).astype(np.int8)
+        resultado = np.empty(precios.size)
+        _descuento_kernel(precios.ravel(), codigos.ravel(), resultado)
+        return resultado.reshape(precios.shape)
+    descuento = np.zeros_like(precios)
+    descuento[tipos == 'VIP'] = 0.20
+    descuento[(tipos == 'REGULAR') & (precios > 100)] = 0.10
+    return np.round(precios * (1 - descuento), 2)
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _descuento_kernel(precios, tipos, resultado):
+        for i in numba.prange(precios.size):
+            p = precios[i]
+            t = tipos[i]
+            d = 0.20 if t == 1 else (0.10 if (t == 2 and p > 100.0) else 0.0)
+            resultado[i] = np.rint(p * (1.0 - d) * 100.0) / 100.0
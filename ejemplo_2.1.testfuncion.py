@@ -2,25 +2,73 @@
 ##Se asume que la función calcular_descuento_final está definida en 'logica_negocio.py'
 
 
-from logica_negocio import calcular_descuento_final
+import logica_negocio
+from logica_negocio import calcular_descuento_final, calcular_descuento_final_vec
+import numpy as np
 import pytest
 
-def test_descuento_cliente_vip(): 
-    """Valida el 20% de descuento para clientes VIP."""
-    assert calcular_descuento_final(200.0, 'VIP') == 160.00
-def test_descuento_cliente_regular_compra_alta() 
-    """Comprueba el 10% de descuento para clientes REGULAR con compras superiores a 100."""
-    assert calcular_descuento_final(150.0, 'REGULAR') == 135.00
-def test_sin_descuento_cliente_regular_compra_baja():
-    """Verifica que clientes REGULAR con compra menor o igual a 100 no reciben descuento."""
-    assert calcular_descuento_final(90.0, 'REGULAR') == 90.00
-def test_precio_base_cero():
-    """Evalúa el comportamiento cuando el precio base es cero."""
-    assert calcular_descuento_final(0.0, 'VIP') == 0.0
+@pytest.fixture(params=["numba", "numpy"])
+def backend_vec(request, monkeypatch):
+    """Ejecuta cada prueba vectorizada con el kernel de Numba y con las máscaras de NumPy."""
+    if request.param == "numba" and logica_negocio.numba is None:
+        pytest.skip("Numba no está instalado")
+    if request.param == "numpy":
+        monkeypatch.setattr(logica_negocio, "numba", None)
+    return request.param
+
+# Casos independientes entre sí: se pueden repartir entre procesos con pytest-xdist (pytest -n auto)
+CASOS_DESCUENTO = [
+    pytest.param(200.0, 'VIP', 160.00, id="cliente_vip"),
+    pytest.param(150.0, 'REGULAR', 135.00, id="regular_compra_alta"),
+    pytest.param(100.004, 'REGULAR', 90.00, id="regular_justo_por_encima_del_umbral"),
+    pytest.param(90.0, 'REGULAR', 90.00, id="regular_compra_baja_sin_descuento"),
+    pytest.param(0.0, 'VIP', 0.0, id="precio_base_cero"),
+    pytest.param(100.0, 'NUEVO', 100.00, id="tipo_cliente_invalido_sin_descuento"),
+]
+
+@pytest.mark.parametrize("precio,tipo,esperado", CASOS_DESCUENTO)
+def test_descuento(precio, tipo, esperado):
+    """Valida el precio final para cada combinación de precio y tipo de cliente."""
+    assert calcular_descuento_final(precio, tipo) == esperado
+def test_sin_descuento_redondea_a_centimos():
+    """Verifica que sin descuento el precio también se redondea a dos decimales."""
+    assert calcular_descuento_final(2.675, 'NUEVO') == round(2.675, 2)
+    assert calcular_descuento_final(10.129, 'REGULAR') == 10.13
+    assert type(calcular_descuento_final(90, 'REGULAR')) is float
 def test_precio_negativo_lanza_excepcion():
     """Confirma que un precio negativo genera un ValueError."""
     with pytest.raises(ValueError, match="El precio base no puede ser negativo."):
          calcular_descuento_final(-50.0, 'REGULAR')
-def test_tipo_cliente_invalido():
-    """Verifica que un tipo de cliente no reconocido no recibe descuento."""
-    assert calcular_descuento_final(100.0, 'NUEVO') == 100.00
+def test_descuento_reutiliza_cache():
+    """Comprueba que una llamada repetida sale de la caché y que cache_clear la vacía."""
+    calcular_descuento_final.cache_clear()
+    assert calcular_descuento_final(150.0, 'REGULAR') == 135.00
+    assert calcular_descuento_final(150.0, 'REGULAR') == 135.00
+    info = calcular_descuento_final.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    calcular_descuento_final.cache_clear()
+    assert calcular_descuento_final.cache_info().currsize == 0
+def test_descuento_cache_no_mezcla_tipos_numericos():
+    """Comprueba que llamar antes con un int o un np.float64 no cambia el tipo devuelto después."""
+    calcular_descuento_final.cache_clear()
+    calcular_descuento_final(90, 'REGULAR')
+    assert type(calcular_descuento_final(90.0, 'REGULAR')) is float
+    calcular_descuento_final(np.float64(150.0), 'REGULAR')
+    assert type(calcular_descuento_final(150.0, 'REGULAR')) is float
+def test_descuento_vectorizado_coincide_con_escalar(backend_vec):
+    """Comprueba que la versión vectorizada da los mismos precios que la escalar."""
+    precios = np.array([caso.values[0] for caso in CASOS_DESCUENTO])
+    tipos = np.array([caso.values[1] for caso in CASOS_DESCUENTO])
+    esperado = [caso.values[2] for caso in CASOS_DESCUENTO]
+    np.testing.assert_array_equal(calcular_descuento_final_vec(precios, tipos), esperado)
+def test_descuento_vectorizado_tipo_unico_se_aplica_a_todos(backend_vec):
+    """Comprueba que un único tipo de cliente se aplica a todos los precios."""
+    np.testing.assert_array_equal(calcular_descuento_final_vec(np.array([200.0] * 5), 'VIP'), [160.0] * 5)
+def test_descuento_vectorizado_formas_incompatibles_lanza_excepcion(backend_vec):
+    """Confirma que precios y tipos de longitudes distintas se rechazan."""
+    with pytest.raises(ValueError):
+         calcular_descuento_final_vec(np.array([200.0] * 5), np.array(['VIP', 'REGULAR']))
+def test_descuento_vectorizado_precio_negativo_lanza_excepcion(backend_vec):
+    """Confirma que la versión vectorizada rechaza precios negativos."""
+    with pytest.raises(ValueError, match="El precio base no puede ser negativo."):
+         calcular_descuento_final_vec(np.array([10.0, -50.0]), np.array(['VIP', 'REGULAR']))
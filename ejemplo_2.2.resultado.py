@@ -1,13 +1,20 @@
 # test_inventario_api.py
+import asyncio
+import json
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, AsyncMock, Mock
 
 # Asumimos que la función está en un archivo llamado 'servicios.py'
-from servicios import obtener_info_producto
+import servicios
+from servicios import obtener_info_producto, obtener_info_productos_bulk
 
 class TestInventarioAPI(unittest.TestCase):
 
-    @patch('servicios.requests.get')
+    def setUp(self):
+        # Cada prueba empieza con la caché vacía
+        obtener_info_producto.cache_clear()
+
+    @patch('servicios._SESSION.get')
     def test_obtener_info_producto_exito(self, mock_get):
         """
         Prueba que la función procesa correctamente una respuesta exitosa (200 OK).
@@ -18,7 +25,7 @@ class TestInventarioAPI(unittest.TestCase):
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = datos_producto_mock
+        mock_response.content = json.dumps(datos_producto_mock).encode()
         mock_get.return_value = mock_response
 
         # 2. Ejecución de la función
@@ -28,7 +35,7 @@ class TestInventarioAPI(unittest.TestCase):
         mock_get.assert_called_once_with(f"https://api.inventario.empresa.com/productos/{producto_id_existente}", timeout=5)
         self.assertEqual(resultado, datos_producto_mock)
 
-    @patch('servicios.requests.get')
+    @patch('servicios._SESSION.get')
     def test_obtener_info_producto_no_encontrado(self, mock_get):
         """
         Prueba que la función devuelve None cuando la API responde con un 404.
@@ -47,5 +54,191 @@ class TestInventarioAPI(unittest.TestCase):
         mock_get.assert_called_once_with(f"https://api.inventario.empresa.com/productos/{producto_id_inexistente}", timeout=5)
         self.assertIsNone(resultado)
 
+    @patch('servicios._SESSION.get')
+    def test_obtener_info_producto_usa_cache(self, mock_get):
+        """
+        Prueba que una segunda consulta del mismo producto no vuelve a llamar a la API.
+        """
+        # 1. Configuración del Mock
+        producto_id = "PROD-123"
+        datos_producto_mock = {"id": "PROD-123", "nombre": "Teclado Mecánico", "stock": 75}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(datos_producto_mock).encode()
+        mock_get.return_value = mock_response
+
+        # 2. Ejecución de la función (dos veces)
+        primero = obtener_info_producto(producto_id)
+        segundo = obtener_info_producto(producto_id)
+
+        # 3. Verificación (Assert)
+        mock_get.assert_called_once()
+        self.assertEqual(primero, datos_producto_mock)
+        self.assertEqual(segundo, datos_producto_mock)
+        self.assertEqual((servicios._HITS, servicios._MISSES), (1, 1))
+
+    @patch('servicios._SESSION.get')
+    def test_obtener_info_producto_cache_no_comparte_objetos(self, mock_get):
+        """
+        Prueba que modificar el resultado devuelto no altera lo que hay en caché.
+        """
+        # 1. Configuración del Mock
+        datos_producto_mock = {"id": "PROD-123", "nombre": "Teclado Mecánico", "stock": 75}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(datos_producto_mock).encode()
+        mock_get.return_value = mock_response
+
+        # 2. Ejecución de la función: cada llamador modifica su copia
+        primero = obtener_info_producto("PROD-123")
+        primero["id"] = "MODIFICADO"
+        segundo = obtener_info_producto("PROD-123")
+        segundo["stock"] = 0
+        tercero = obtener_info_producto("PROD-123")
+
+        # 3. Verificación (Assert)
+        mock_get.assert_called_once()
+        self.assertEqual(tercero, datos_producto_mock)
+
+    @patch('servicios._SESSION.get')
+    def test_obtener_info_producto_404_caduca_antes(self, mock_get):
+        """
+        Prueba que un 404 se guarda en caché solo durante el TTL corto.
+        """
+        # 1. Configuración del Mock y de un reloj controlado
+        reloj = [1000.0]
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        with patch('servicios.time.monotonic', side_effect=lambda: reloj[0]):
+            # 2. Ejecución de la función dentro y fuera del TTL
+            self.assertIsNone(obtener_info_producto("PROD-999"))
+            reloj[0] += servicios._TTL_NO_ENCONTRADO - 1
+            self.assertIsNone(obtener_info_producto("PROD-999"))
+            self.assertEqual(mock_get.call_count, 1)
+            reloj[0] += 2
+            self.assertIsNone(obtener_info_producto("PROD-999"))
+
+        # 3. Verificación (Assert)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual((servicios._HITS, servicios._MISSES), (1, 2))
+
+class TestInventarioAPIAsync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        obtener_info_producto.cache_clear()
+
+    @patch('servicios.httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_obtener_info_productos_bulk(self, mock_get):
+        """
+        Prueba que la consulta en bloque devuelve los resultados en orden y respeta el 200/404.
+        """
+        # 1. Configuración del Mock
+        datos_producto_mock = {"id": "PROD-123", "nombre": "Teclado Mecánico", "stock": 75}
+
+        async def responder(url, **kwargs):
+            mock_response = Mock()
+            if url.endswith("PROD-123"):
+                mock_response.status_code = 200
+                mock_response.content = json.dumps(datos_producto_mock).encode()
+            else:
+                mock_response.status_code = 404
+            return mock_response
+        mock_get.side_effect = responder
+
+        # 2. Ejecución de la función
+        resultado = await obtener_info_productos_bulk(["PROD-123", "PROD-999"])
+
+        # 3. Verificación (Assert)
+        self.assertEqual(mock_get.await_count, 2)
+        mock_get.assert_any_await("https://api.inventario.empresa.com/productos/PROD-999", timeout=5, follow_redirects=True)
+        self.assertEqual(resultado, [datos_producto_mock, None])
+
+    async def test_obtener_info_productos_bulk_concurrencia_invalida(self):
+        """
+        Prueba que una concurrencia menor que 1 se rechaza en lugar de bloquearse.
+        """
+        with self.assertRaises(ValueError):
+            await obtener_info_productos_bulk(["PROD-123"], max_concurrency=0)
+
+    @patch('servicios.httpx.AsyncClient.send', new_callable=AsyncMock)
+    async def test_obtener_info_productos_bulk_id_invalido(self, mock_send):
+        """
+        Prueba que un ID que genera una URL inválida devuelve None sin perder el resto del bloque.
+        """
+        # 1. Configuración del Mock: solo se simula el envío, la URL la valida httpx de verdad
+        datos_producto_mock = {"id": "PROD-2", "nombre": "Ratón", "stock": 10}
+
+        async def responder(request, **kwargs):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps(datos_producto_mock).encode()
+            return mock_response
+        mock_send.side_effect = responder
+
+        # 2. Ejecución de la función
+        resultado = await obtener_info_productos_bulk(["PROD\x00-1", "PROD-2"])
+
+        # 3. Verificación (Assert)
+        self.assertEqual(mock_send.await_count, 1)
+        self.assertEqual(resultado, [None, datos_producto_mock])
+
+    @patch('servicios.httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_obtener_info_productos_bulk_limita_concurrencia(self, mock_get):
+        """
+        Prueba que nunca hay más de max_concurrency peticiones en curso a la vez.
+        """
+        # 1. Configuración del Mock: cuenta las peticiones simultáneas
+        en_curso = 0
+        maximo = 0
+
+        async def responder(url, **kwargs):
+            nonlocal en_curso, maximo
+            en_curso += 1
+            maximo = max(maximo, en_curso)
+            await asyncio.sleep(0.01)
+            en_curso -= 1
+            mock_response = Mock()
+            mock_response.status_code = 404
+            return mock_response
+        mock_get.side_effect = responder
+
+        # 2. Ejecución de la función
+        ids = [f"PROD-{i}" for i in range(5)]
+        resultado = await obtener_info_productos_bulk(ids, max_concurrency=2)
+
+        # 3. Verificación (Assert)
+        self.assertEqual(mock_get.await_count, 5)
+        self.assertEqual(maximo, 2)
+        self.assertEqual(resultado, [None] * 5)
+
+    @patch('servicios._SESSION.get')
+    @patch('servicios.httpx.AsyncClient.get', new_callable=AsyncMock)
+    async def test_obtener_info_productos_bulk_comparte_cache(self, mock_get_async, mock_get):
+        """
+        Prueba que lo consultado en bloque se reutiliza en otra consulta en bloque y en la versión síncrona.
+        """
+        # 1. Configuración del Mock
+        datos_producto_mock = {"id": "PROD-123", "nombre": "Teclado Mecánico", "stock": 75}
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(datos_producto_mock).encode()
+        mock_get_async.return_value = mock_response
+
+        # 2. Ejecución de la función: bloque, bloque de nuevo y consulta síncrona
+        primero = await obtener_info_productos_bulk(["PROD-123"])
+        segundo = await obtener_info_productos_bulk(["PROD-123"])
+        sincrono = obtener_info_producto("PROD-123")
+
+        # 3. Verificación (Assert)
+        mock_get_async.assert_awaited_once()
+        mock_get.assert_not_called()
+        self.assertEqual(primero, [datos_producto_mock])
+        self.assertEqual(segundo, [datos_producto_mock])
+        self.assertEqual(sincrono, datos_producto_mock)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,21 +1,129 @@
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+import httpx
 import requests
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson es opcional: sin él se usa el parser de la librería estándar
+    import json
+    _json_loads = json.loads
+
+# Sesión compartida: reutiliza las conexiones HTTP (keep-alive) entre llamadas
+_SESSION = requests.Session()
+
+# Caché LRU con caducidad para no repetir consultas del mismo producto.
+# Los 404 se guardan con un TTL más corto para no saturar la API con IDs inexistentes.
+# Se guardan y se devuelven copias, para que un llamador no pueda modificar la entrada de otro.
+_CACHE_MAX = 10_000
+_TTL_ENCONTRADO = 300.0
+_TTL_NO_ENCONTRADO = 30.0
+_cache: "OrderedDict[str, tuple[float, dict | None]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_HITS = 0
+_MISSES = 0
+_NO_EN_CACHE = object()
+
+def _leer_cache(producto_id: str):
+    """Devuelve los datos guardados del producto, o _NO_EN_CACHE si no hay entrada vigente."""
+    global _HITS, _MISSES
+    with _cache_lock:
+        entrada = _cache.get(producto_id)
+        if entrada is not None and entrada[0] > time.monotonic():
+            _cache.move_to_end(producto_id)
+            _HITS += 1
+            return copy.deepcopy(entrada[1])
+        _MISSES += 1
+        return _NO_EN_CACHE
+
+def _guardar_en_cache(producto_id: str, datos: dict | None, ttl: float) -> None:
+    with _cache_lock:
+        _cache[producto_id] = (time.monotonic() + ttl, copy.deepcopy(datos))
+        _cache.move_to_end(producto_id)
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+
+def _procesar_respuesta(producto_id: str, response) -> dict | None:
+    """Interpreta una respuesta de requests o httpx y la guarda en caché si es 200 o 404."""
+    if response.status_code == 200:
+        datos = _json_loads(response.content)
+        _guardar_en_cache(producto_id, datos, _TTL_ENCONTRADO)
+        return datos
+    elif response.status_code == 404:
+        _guardar_en_cache(producto_id, None, _TTL_NO_ENCONTRADO)
+        return None
+    # En un caso real, manejaríamos otros códigos de error
+    response.raise_for_status()
+
 def obtener_info_producto(producto_id: str) -> dict | None:
     """
     Consulta el microservicio de inventario para obtener los datos de un producto.
     Devuelve un diccionario con los datos si el producto existe (HTTP 200).
     Devuelve None si el producto no se encuentra (HTTP 404).
+    Las respuestas 200 y 404 se guardan en caché durante un tiempo limitado.
     """
+    datos = _leer_cache(producto_id)
+    if datos is not _NO_EN_CACHE:
+        return datos
+
     url = f"https://api.inventario.empresa.com/productos/{producto_id}"
     try:
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            return None
-        # En un caso real, manejaríamos otros códigos de error
-        response.raise_for_status() 
-    except requests.exceptions.RequestException as e:
+        response = _SESSION.get(url, timeout=5)
+        return _procesar_respuesta(producto_id, response)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # ValueError cubre también un cuerpo JSON inválido (json/orjson.JSONDecodeError)
         # Log del error en un sistema de monitoreo
         print(f"Error al conectar con la API de inventario: {e}")
-        return None
\ No newline at end of file
+        return None
+
+async def obtener_info_producto_async(producto_id: str, client: httpx.AsyncClient) -> dict | None:
+    """
+    Versión asíncrona de obtener_info_producto que reutiliza el cliente httpx recibido.
+    Mantiene la misma semántica (200 -> datos, 404 -> None) y comparte la caché.
+    """
+    datos = _leer_cache(producto_id)
+    if datos is not _NO_EN_CACHE:
+        return datos
+
+    url = f"https://api.inventario.empresa.com/productos/{producto_id}"
+    try:
+        # requests sigue las redirecciones por defecto; httpx no, así que se pide explícitamente
+        response = await client.get(url, timeout=5, follow_redirects=True)
+        return _procesar_respuesta(producto_id, response)
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+        # httpx.InvalidURL no hereda de HTTPError; sin capturarlo, un ID inválido abortaría todo el bloque
+        # Log del error en un sistema de monitoreo
+        print(f"Error al conectar con la API de inventario: {e}")
+        return None
+
+async def obtener_info_productos_bulk(producto_ids: list[str], *, max_concurrency: int = 32) -> list[dict | None]:
+    """
+    Consulta varios productos en paralelo con un único cliente httpx.
+    Como mucho se lanzan max_concurrency peticiones a la vez.
+    Devuelve los resultados en el mismo orden que producto_ids.
+    - Lanza un ValueError si max_concurrency no es al menos 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency debe ser al menos 1.")
+    semaforo = asyncio.Semaphore(max_concurrency)
+    limites = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+    async with httpx.AsyncClient(limits=limites, follow_redirects=True) as client:
+        async def _consultar(producto_id: str) -> dict | None:
+            async with semaforo:
+                return await obtener_info_producto_async(producto_id, client)
+        return await asyncio.gather(*(_consultar(producto_id) for producto_id in producto_ids))
+
+def _limpiar_cache() -> None:
+    """Vacía la caché de productos y reinicia los contadores."""
+    global _HITS, _MISSES
+    with _cache_lock:
+        _cache.clear()
+        _HITS = 0
+        _MISSES = 0
+
+obtener_info_producto.cache_clear = _limpiar_cache
\ No newline at end of file